@@ -1,4 +1,5 @@
 import logging as lg
+from concurrent.futures import ThreadPoolExecutor
 
 import polars as pl
 from rich.progress import (
@@ -9,13 +10,26 @@ from rich.progress import (
     TimeElapsedColumn,
 )
 
-from ematools.helper import cache_df
-from ematools.parse import (
-    medicine_maintable,
+from ematools.helper import cache_df, compact_request_log
+from ematools.scrape import (
+    _PROC_SCHEMA,
+    normalize_text,
     parse_main_register,
+    parse_medicine_page_top,
     parse_procedures_rows,
 )
 
+MAX_WORKERS = 16
+_PAGE_TOP_SCHEMA = {
+    "id": pl.Int64,
+    "eu_number": pl.String,
+    "name": pl.String,
+    "inn": pl.String,
+    "mah": pl.String,
+    "atc": pl.String,
+    "ema_links": pl.String,
+}
+
 
 def with_progress(func, total, description="Processing..."):
     """
@@ -34,6 +48,8 @@ def with_progress(func, total, description="Processing..."):
         BarColumn(),
         MofNCompleteColumn(),
         TimeElapsedColumn(),
+        refresh_per_second=4,
+        transient=True,
     )
     task = progress.add_task(description, total=total)
 
@@ -60,21 +76,44 @@ def medicines_register() -> pl.DataFrame:
 
     """
     df = parse_main_register()
-    df = df.with_columns(
-        pl.struct(pl.all())
-        .map_elements(
-            medicine_maintable,
-            return_dtype=pl.Struct(
-                {
-                    "mah": pl.String,
-                    "atc": pl.String,
-                    "ema_links": pl.String,
-                }
-            ),
+    ids = df.get_column("id").to_list()
+
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        tops = [
+            {**top, "id": id_}
+            for id_, top in zip(ids, executor.map(parse_medicine_page_top, ids))
+        ]
+
+    df = df.join(
+        pl.DataFrame(tops, schema=_PAGE_TOP_SCHEMA), on="id", how="left", suffix="_page"
+    )
+    _warn_mismatches(df, ["name", "eu_number", "inn"], suffix="_page")
+    _compact_request_log()
+    return df.drop("name_page", "eu_number_page", "inn_page")
+
+
+def _compact_request_log() -> None:
+    """Compacts the request log, logging rather than raising on failure, so the
+    bookkeeping can never abort a data build."""
+    try:
+        compact_request_log()
+    except Exception as e:
+        lg.warning(f"Failed to compact the request log: {e}")
+
+
+def _warn_mismatches(df: pl.DataFrame, columns: list[str], suffix: str) -> None:
+    """Logs rows where the register and product page disagree on a column."""
+    for col in columns:
+        other = f"{col}{suffix}"
+        candidates = df.filter(
+            pl.col(other).is_not_null() & (pl.col(col).cast(pl.String) != pl.col(other))
         )
-        .alias("result")
-    ).unnest("result")
-    return df
+        for v_register, v_page in candidates.select(col, other).iter_rows():
+            if normalize_text(str(v_register)) != normalize_text(str(v_page)):
+                lg.warning(
+                    f"{col}: {v_register},{v_page} not completely equivalent, "
+                    "will merge anyways"
+                )
 
 
 @cache_df()
@@ -96,33 +135,29 @@ def procedures() -> pl.DataFrame:
     """
     df_main = medicines_register()
 
-    schema = pl.List(
-        pl.Struct({k: pl.String for k, _ in parse_procedures_rows(1)[0].items()})
-    )
+    ids = df_main.get_column("id").to_list()
 
     progress_bar, procedures_with_progress = with_progress(
         parse_procedures_rows,
-        total=len(df_main),
+        total=len(ids),
         description="Processing procedures...",
     )
 
-    with progress_bar:
+    with progress_bar, ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
         lg.debug("starting")
-        df = (
-            df_main.with_columns(
-                pl.col("id")
-                .map_elements(procedures_with_progress, return_dtype=schema)
-                .alias("procedures")
-            )
-            .explode("procedures")
-            .unnest("procedures")
-        )
+        rows = [
+            {**row, "id": id_}
+            for id_, id_rows in zip(ids, executor.map(procedures_with_progress, ids))
+            for row in id_rows
+        ]
         lg.debug("done")
 
-    progress_bar, procedures_with_progress = with_progress(
-        parse_procedures_rows,
-        total=len(df_main),
-        description="Processing procedures...",
+    df_procs = pl.DataFrame(rows, schema={"id": pl.Int64} | _PROC_SCHEMA)
+    df = (
+        df_main.lazy()
+        .join(df_procs.lazy(), on="id", how="left", maintain_order="left")
+        .collect(engine="streaming")
     )
+    _compact_request_log()
 
     return df
@@ -7,23 +7,63 @@ as parquet files using pystow for data management.
 import functools
 import hashlib
 import io
+import json
 import logging as lg
+import os
 from datetime import datetime
 from pathlib import Path
-from threading import Lock
+from threading import Lock, get_ident
 from typing import Any, Callable
 
 import polars as pl
 import pystow
 import requests
+import zstandard as zstd
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 MAINMODULE = pystow.module("ematools")
 CACHEDIR = MAINMODULE.join("cache")
 REQUESTDIR = MAINMODULE.join("cache", "requests")
+MAX_RETRIES = 3
 _log_lock = Lock()
+_LOG_SCHEMA = {
+    "filename": pl.String,
+    "url": pl.String,
+    "timestamp": pl.String,
+    "status_code": pl.Int64,
+}
 
 
-def cache_df(folder: Path = CACHEDIR, cache_key: str | None = None) -> Callable:
+@functools.cache
+def _session(max_retries: int) -> requests.Session:
+    """Returns the keep-alive session retrying up to `max_retries` times.
+
+    One session is kept per retry count, so the TCP+TLS connection to the
+    register host is reused instead of renegotiated on every cache miss.
+    """
+    session = requests.Session()
+    session.mount(
+        "https://",
+        HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=max_retries,
+                backoff_factor=0.3,
+                status_forcelist=(429, 500, 502, 503, 504),
+            ),
+        ),
+    )
+    return session
+
+
+def cache_df(
+    folder: Path = CACHEDIR,
+    cache_key: str | None = None,
+    columns: list[str] | None = None,
+    lazy: bool = False,
+) -> Callable:
     """Decorator that caches DataFrame results as parquet files using pystow.
 
     This decorator wraps functions that return polars DataFrames and automatically
@@ -36,6 +76,11 @@ def cache_df(folder: Path = CACHEDIR, cache_key: str | None = None) -> Callable:
                   are stored (defaults to pystow' cachedir (`~/.data/ematools/cache`)).
         cache_key: Optional custom name for the cache file (without extension).
                   If not provided, uses the function name.
+        columns: Optional subset of columns to return. On a cache hit only these
+                  columns are read from the parquet file.
+        lazy: If True, the wrapped function returns a pl.LazyFrame scanning the
+                  cached parquet file, so downstream filters and projections are
+                  pushed down into the read. Defaults to False.
 
     Returns:
         A decorator function that wraps the target function with caching logic.
@@ -53,40 +98,75 @@ def cache_df(folder: Path = CACHEDIR, cache_key: str | None = None) -> Callable:
         ... def process_data() -> pl.DataFrame:
         ...     return pl.DataFrame({"data": [4, 5, 6]})
 
+        >>> @cache_df(lazy=True)
+        ... def big_table() -> pl.DataFrame:
+        ...     return pl.DataFrame({"id": [1, 2], "value": ["a", "b"]})
+        ...
+        >>> big_table().filter(pl.col("id") == 1).collect()
+
     Notes:
         - The decorated function must return a polars DataFrame.
-        - Cache files are stored as parquet format.
+        - Cache files are stored as zstd-compressed parquet with column
+          statistics, and are memory-mapped on read.
         - The cache location is managed by pystow and can be found at:
           ~/.data/{module_name}/{subfolder}/{cache_key}.parquet
     """
 
-    def decorator(func: Callable[..., pl.DataFrame]) -> Callable[..., pl.DataFrame]:
+    def decorator(
+        func: Callable[..., pl.DataFrame],
+    ) -> Callable[..., pl.DataFrame | pl.LazyFrame]:
         @functools.wraps(func)
-        def wrapper(*args: Any, **kwargs: Any) -> pl.DataFrame:
+        def wrapper(*args: Any, **kwargs: Any) -> pl.DataFrame | pl.LazyFrame:
             filename = cache_key if cache_key else func.__name__
             filepath: Path = Path(folder) / f"{filename}.parquet"
 
             if filepath.exists():
                 lg.debug(f"cached file {filepath} exists, reading from cached file")
-                return pl.read_parquet(filepath)
+                if lazy:
+                    lf = pl.scan_parquet(filepath)
+                    return lf.select(columns) if columns else lf
+                return pl.read_parquet(
+                    filepath, columns=columns, memory_map=True, low_memory=False
+                )
 
             df = func(*args, **kwargs)
-            df.write_parquet(filepath)
-            return df
+            tmp = filepath.with_suffix(".parquet.tmp")
+            df.write_parquet(
+                tmp, compression="zstd", compression_level=3, statistics=True
+            )
+            os.replace(tmp, filepath)
+            if lazy:
+                df = df.lazy()
+            return df.select(columns) if columns else df
 
         return wrapper
 
     return decorator
 
 
+def _cache_file(url: str, cache_dir: Path) -> Path:
+    """Location of the cached response body of `url` in `cache_dir`."""
+    url_hash = hashlib.sha256(url.encode()).hexdigest()
+    return Path(cache_dir) / f"{url_hash}.html.zst"
+
+
+def is_cached(url: str, cache_dir: Path = REQUESTDIR) -> bool:
+    """Checks whether `cached_get` has a cached response for `url`."""
+    return _cache_file(url, cache_dir).exists()
+
+
 def cached_get(
     url: str,
     force: bool = False,
     cache_dir: Path = REQUESTDIR,
-    max_retries: int = 3,
+    max_retries: int = MAX_RETRIES,
 ) -> requests.Response:
     """Makes an HTTP GET request with caching.
 
+    Response bodies are cached zstd-compressed under the sha256 of the url.
+    Requests go through a shared keep-alive session that retries failed
+    requests with exponential backoff.
+
     Args:
     ---
         url: The URL to fetch.
@@ -105,60 +185,133 @@ def cached_get(
     cache_dir = Path(cache_dir)
     cache_dir.mkdir(parents=True, exist_ok=True)
 
-    url_hash = hashlib.sha256(url.encode()).hexdigest()[:16]
-    cache_file = cache_dir / f"{url.split('/')[-1].split('.')[0][:25]}_{url_hash}.html"
-    log_file = cache_dir / "request_log.parquet"
+    cache_file = _cache_file(url, cache_dir)
+    log_file = cache_dir / "request_log.jsonl"
 
     # Return cached response if available
     if not force and cache_file.exists():
         response = requests.Response()
         response.status_code = 200
-        response._content = cache_file.read_bytes()
+        response._content = zstd.decompress(cache_file.read_bytes())
         response.url = url
         return response
 
-    # Make request with retries
-    for attempt in range(max_retries):
-        try:
-            response = requests.get(url)
-            if response.status_code == 200:
-                cache_file.write_bytes(response.content)
-
-                # Update log with Polars
-                new_entry = pl.DataFrame(
-                    {
-                        "filename": [cache_file.name],
-                        "url": [url],
-                        "timestamp": [datetime.now()],
-                        "status_code": [response.status_code],
-                    }
+    try:
+        response = _session(max_retries).get(url, timeout=30)
+    except requests.RequestException as e:
+        lg.warning(f"Request on {url} failed with warning {e}")
+        raise
+
+    if response.status_code != 200:
+        raise requests.RequestException(
+            f"Failed to fetch {url} (status {response.status_code})"
+        )
+
+    # Write to a per-thread temporary file first, so neither an interrupt nor a
+    # concurrent fetch of the same url can leave a truncated cache file behind
+    tmp = cache_file.with_suffix(f"{cache_file.suffix}.{get_ident()}.tmp")
+    tmp.write_bytes(zstd.compress(response.content, level=3))
+    os.replace(tmp, cache_file)
+
+    entry = {
+        "filename": cache_file.name,
+        "url": url,
+        "timestamp": datetime.now().isoformat(timespec="microseconds"),
+        "status_code": response.status_code,
+    }
+    with _log_lock, open(log_file, "a") as f:
+        f.write(json.dumps(entry) + "\n")
+
+    return response
+
+
+def url_exists(url: str) -> bool:
+    """Checks whether `url` resolves, using a cheap (uncached) HEAD request on the
+    shared session.
+
+    Args:
+    ---
+        url: The URL to probe.
+
+    Returns:
+    ---
+        True if the server answers with status 200, False if it answers 404.
+
+    Raises:
+    ---
+        requests.RequestException: If the request fails, or the server answers
+        with any other status.
+    """
+    try:
+        response = _session(MAX_RETRIES).head(url, timeout=30, allow_redirects=True)
+    except requests.RequestException as e:
+        lg.warning(f"HEAD request on {url} failed with warning {e}")
+        raise
+
+    if response.status_code == 404:
+        return False
+    if response.status_code != 200:
+        raise requests.RequestException(
+            f"Failed to probe {url} (status {response.status_code})"
+        )
+    return True
+
+
+def compact_request_log(cache_dir: Path = REQUESTDIR) -> pl.DataFrame:
+    """Compacts the append-only request log into `request_log.parquet`.
+
+    `cached_get` appends one line per fetched url to `request_log.jsonl`; this
+    merges those lines into the parquet log (keeping only the latest entry per
+    url) and empties the jsonl file, so each compaction only handles the new
+    entries.
+
+    Args:
+    ---
+        cache_dir: Directory where the request cache and its log are stored.
+
+    Returns:
+    ---
+        A pl.DataFrame with the filename, url, timestamp and status code of the
+        latest request per url.
+    """
+    cache_dir = Path(cache_dir)
+    jsonl_file = cache_dir / "request_log.jsonl"
+    log_file = cache_dir / "request_log.parquet"
+
+    with _log_lock:
+        frames = []
+        if log_file.exists():
+            try:
+                frames.append(pl.read_parquet(log_file))
+            except Exception as e:
+                lg.warning(f"Failed to read log file, creating new: {e}")
+        if jsonl_file.exists() and jsonl_file.stat().st_size > 0:
+            entries = []
+            with open(jsonl_file) as f:
+                for line in f:
+                    # An interrupted append can leave a truncated line behind
+                    try:
+                        entries.append(json.loads(line))
+                    except json.JSONDecodeError:
+                        lg.warning(f"Skipping malformed request log line: {line!r}")
+            if entries:
+                frames.append(
+                    pl.DataFrame(entries, schema=_LOG_SCHEMA).with_columns(
+                        pl.col("timestamp").str.to_datetime()
+                    )
                 )
+        if not frames:
+            return pl.DataFrame()
 
-                with _log_lock:
-                    if log_file.exists():
-                        try:
-                            log_df = pl.read_parquet(log_file)
-                            log_df = pl.concat(
-                                [log_df.filter(pl.col("url") != url), new_entry]
-                            )
-                        except Exception as e:
-                            lg.warning(f"Failed to read log file, creating new: {e}")
-                            log_df = new_entry
-                    else:
-                        log_df = new_entry
-                    log_df.write_parquet(log_file)
-
-                return response
-
-        except requests.RequestException as e:
-            if attempt == max_retries - 1:
-                lg.warning(f"Attempt {attempt} on {url} with warning {e}")
-                raise
-            continue
-
-    raise requests.RequestException(
-        f"Failed to fetch {url} after {max_retries} attempts"
-    )
+        log_df = pl.concat(frames, how="vertical_relaxed").unique(
+            subset=["url"], keep="last", maintain_order=True
+        )
+        tmp = cache_dir / "request_log.parquet.tmp"
+        log_df.write_parquet(tmp)
+        os.replace(tmp, log_file)
+        jsonl_file.write_text("")
+
+    return log_df
 
 
 def cached_pdf(link: str, stream=True) -> bytes | io.BytesIO:
@@ -179,3 +332,4 @@ def cached_pdf(link: str, stream=True) -> bytes | io.BytesIO:
     if stream:
         return io.BytesIO(pdf_bytes)
     return pdf_bytes
+
@@ -1,19 +1,45 @@
+import functools
 import io
-import json
 import logging as lg
 import re
 import unicodedata
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import orjson
 import polars as pl
 import pymupdf
 
-from ematools.helper import cache_df, cached_get
-
-
-def _clean_json(json: str) -> str:
+from ematools.helper import cache_df, cached_get, is_cached, url_exists
+
+_REGISTER_URL = "https://ec.europa.eu/health/documents/community-register/html"
+# Number of register pages probed (and fetched) concurrently
+_PAGE_BATCH = 8
+# Upper bound on the number of register pages
+_MAX_PAGES = 29
+
+_PROC_FIELDS = (
+    "close_date",
+    "procedure_type",
+    "ema_number",
+    "decision_number",
+    "summary_en",
+    "decisions_en",
+    "annexes_en",
+)
+_PROC_SCHEMA = {k: pl.String for k in _PROC_FIELDS}
+
+# Patterns work on the raw (UTF-8) response bytes to skip decoding whole pages
+_RE_DATASET = re.compile(rb"var dataSet = (\[.*?\]);", re.DOTALL)
+_RE_PRODUCT = re.compile(rb"var dataSet_product_information = (\[.*?\]);", re.DOTALL)
+_RE_PROC = re.compile(rb"var dataSet_proc = (\[.*?\]);", re.DOTALL)
+# C0 controls and DEL, plus the UTF-8 encoding of the C1 controls (U+0080-U+009F)
+_RE_CTRL = re.compile(rb"[\x00-\x1f\x7f]|\xc2[\x80-\x9f]")
+
+
+def _clean_json(json: bytes) -> bytes:
     """cleans json characters"""
-    return re.sub(r"[\x00-\x1f\x7f-\x9f]", " ", json)
+    return _RE_CTRL.sub(b" ", json)
 
 
 def normalize_text(text: str) -> str:
@@ -48,64 +74,126 @@ def normalize_text(text: str) -> str:
     return unicodedata.normalize("NFC", text)
 
 
+def _register_page_url(page: int) -> str:
+    if page == 1:
+        return f"{_REGISTER_URL}/reg_hum_act.htm"
+    return f"{_REGISTER_URL}/reg_hum_act{page}.htm"
+
+
+def _register_page_exists(page: int) -> bool:
+    url = _register_page_url(page)
+    # Cached pages need no request, so a fully cached register rebuilds offline
+    return is_cached(url) or url_exists(url)
+
+
+def _count_register_pages(executor: ThreadPoolExecutor) -> int:
+    """Probes the register pages with concurrent HEAD requests, in batches of
+    `_PAGE_BATCH`, and returns the number of consecutive existing pages (at most
+    `_MAX_PAGES`).
+    """
+    n_pages = 0
+    while n_pages < _MAX_PAGES:
+        batch = range(n_pages + 1, min(n_pages + _PAGE_BATCH, _MAX_PAGES) + 1)
+        for exists in executor.map(_register_page_exists, batch):
+            if not exists:
+                return n_pages
+            n_pages += 1
+    lg.warning(f"Stopped probing register pages at the limit of {_MAX_PAGES}")
+    return n_pages
+
+
 @cache_df()
 def parse_main_register() -> pl.DataFrame:
     """Parse EU medicines register from JavaScript dataSet variable."""
 
-    all_data = []
-    page = 1
-    base = "https://ec.europa.eu/health/documents/community-register/html"
+    with ThreadPoolExecutor(max_workers=_PAGE_BATCH) as executor:
+        n_pages = _count_register_pages(executor)
+        lg.debug(f"Found {n_pages} register pages")
+        if not n_pages:
+            raise RuntimeError(f"No register pages found at {_register_page_url(1)}")
+        urls = [_register_page_url(page) for page in range(1, n_pages + 1)]
+        responses = list(executor.map(cached_get, urls))
+
+    # Flatten the nested eu_num structure per page, so only small frames are kept
+    eu_num = pl.col("eu_num").struct
+    frames = []
+    for page, r in enumerate(responses, start=1):
+        match = _RE_DATASET.search(r.content)
+        if not match:
+            lg.debug(f"No match on page {page}")
+            break
 
-    while True:
-        url = (
-            f"{base}/reg_hum_act.htm" if page == 1 else f"{base}/reg_hum_act{page}.htm"
+        data = orjson.loads(_clean_json(match.group(1)))
+        frames.append(
+            pl.from_dicts(data, infer_schema_length=None).select(
+                eu_num.field("display").alias("eu_number"),
+                eu_num.field("pre"),
+                eu_num.field("id"),
+                "name",
+                "inn",
+                "indication",
+                "company",
+            )
         )
-        r = cached_get(url)
 
-        if r.status_code != 200:
-            lg.debug(f"Stopped traversing at page {page} as it did not exist")
-            break
+    if not frames:
+        raise RuntimeError(f"No dataSet found on {_register_page_url(1)}")
 
-        match = re.search(r"var dataSet = (\[.*?\]);", r.text, re.DOTALL)
-        if not match:
-            lg.debug(f"No match on page {page}")
-            break
+    df = pl.concat(frames, how="vertical_relaxed").with_columns(
+        pl.col("indication")
+        .str.replace_all(r"<br/?>|</?u>|• ", " ")
+        .str.strip_chars()
+    )
 
-        data = json.loads(_clean_json(match.group(1)))
-        all_data.extend(data)
-        page += 1
+    return df.cast({"id": pl.Int64})
 
-    # Flatten nested eu_num structure
-    rows = []
-    for item in all_data:
-        rows.append(
-            {
-                "eu_number": item["eu_num"]["display"],
-                "pre": item["eu_num"]["pre"],
-                "id": item["eu_num"]["id"],
-                "name": item["name"],
-                "inn": item["inn"],
-                "indication": item["indication"]
-                .replace("<br/>", " ")
-                .replace("<br>", " ")
-                .replace("<u>", " ")
-                .replace("</u>", " ")
-                .replace("• ", " ")
-                .strip(),
-                "company": item["company"],
-            }
-        )
 
-    return pl.DataFrame(rows).cast({"id": pl.Int64})
+def _set_value(item: dict, out: dict) -> None:
+    out[item["type"]] = item["value"]
+
+
+def _set_eu_number(item: dict, out: dict) -> None:
+    out["eu_number"] = item["value"]
+
+
+def _set_atc(item: dict, out: dict) -> None:
+    out["atc"] = ";".join(
+        d["code"] for atc_entry in item["meta"] for d in atc_entry if d["level"] == "5"
+    )
+
+
+def _set_ema_links(item: dict, out: dict) -> None:
+    out["ema_links"] = ";".join(d["url"] for d in item["meta"])
+
 
+def _skip(item: dict, out: dict) -> None:
+    pass
 
-def medicine_page(idx: int | str, pre: str = "h") -> str:
+
+# Handlers per `type` of the product information table, filling the output dict
+_PAGE_TOP_HANDLERS = {
+    "eu_num": _set_eu_number,
+    "name": _set_value,
+    "inn": _set_value,
+    "indication": _set_value,
+    "mah": _set_value,
+    "atc": _set_atc,
+    "ema_links": _set_ema_links,
+    "orphan_links": _skip,
+}
+
+
+@functools.lru_cache(maxsize=4096)
+def medicine_page(idx: int | str, pre: str = "h") -> bytes:
+    """Returns the raw html of a product page, kept in memory for the current run
+    so the register and procedure parsers share a single cache read per page.
+    """
     if isinstance(idx, int) and idx < 1000:
         idx = f"{idx:03d}"
     base = (
         f"https://ec.europa.eu/health/documents/community-register/html/{pre}{idx}.htm"
     )
-    return cached_get(base).text
+    return cached_get(base).content
 
 
 def parse_medicine_page_top(idx: int) -> dict:
@@ -115,52 +203,19 @@ def parse_medicine_page_top(idx: int) -> dict:
 
     html = medicine_page(idx)
 
-    match = re.search(r"var dataSet_product_information = (\[.*?\]);", html, re.DOTALL)
+    match = _RE_PRODUCT.search(html)
     if not match:
         return {}
 
-    all_data = json.loads(_clean_json(match.group(1)))
+    all_data = orjson.loads(_clean_json(match.group(1)))
     cleaned_data = {}
     for item in all_data:
-        match t := item["type"]:
-            case "eu_num":
-                cleaned_data["eu_number"] = item["value"]
-            case "name" | "inn" | "indication" | "mah":
-                cleaned_data[t] = item["value"]
-            case "atc":
-                atcs = []
-                for atc_entry in item["meta"]:
-                    for level_dict in atc_entry:
-                        if level_dict["level"] == "5":
-                            atcs.append(level_dict["code"])
-                cleaned_data[t] = ";".join(atcs)
-            case "ema_links":
-                cleaned_data[t] = ";".join([d["url"] for d in item["meta"]])
-            case "orphan_links":
-                continue
-            case _:
-                lg.warning(f"Encountered unknown type: {t}, skipping")
-                continue
-    return cleaned_data
-
-
-def medicine_maintable(row: dict) -> dict:
-    data = parse_medicine_page_top(row["id"])
-    if "indication" in data:
-        data.pop("indication")
-    for type_ in ["name", "eu_number", "inn"]:
-        if type_ not in data:
+        handler = _PAGE_TOP_HANDLERS.get(t := item["type"])
+        if handler is None:
+            lg.warning(f"Encountered unknown type: {t}, skipping")
             continue
-        v = data.pop(type_)
-        row_val_norm = normalize_text(str(row[type_]))
-        v_norm = normalize_text(str(v))
-
-        if row_val_norm != v_norm:
-            # Log the mismatch with details for debugging
-            lg.warning(
-                f"{type_}: {row[type_]},{v} not completely equivalent, will merge anyways"
-            )
-    return data
+        handler(item, cleaned_data)
+    return cleaned_data
 
 
 def parse_procedures(idx: int | str) -> pl.DataFrame:
@@ -171,22 +226,21 @@ def parse_procedures(idx: int | str) -> pl.DataFrame:
     where date is the decision date."""
 
     html = medicine_page(idx)
-    match = re.search(r"var dataSet_proc = (\[.*?\]);", html, re.DOTALL)
+    match = _RE_PROC.search(html)
     if not match:
-        return pl.DataFrame()
+        return pl.DataFrame(schema=_PROC_SCHEMA)
 
-    data = json.loads(match.group(1))
+    data = orjson.loads(match.group(1))
     base_url = "https://ec.europa.eu/health/documents/community-register"
 
     rows = []
     for rec in data:
         proc_id = rec["id"]
-        row = {
-            "close_date": rec.get("closed"),
-            "procedure_type": rec.get("type"),
-            "ema_number": rec.get("ema_number"),
-            "decision_number": rec.get("decision", {}).get("number"),
-        }
+        row = dict.fromkeys(_PROC_FIELDS)
+        row["close_date"] = rec.get("closed")
+        row["procedure_type"] = rec.get("type")
+        row["ema_number"] = rec.get("ema_number")
+        row["decision_number"] = rec.get("decision", {}).get("number")
 
         # Build EN URLs if files exist and decision date is available
         dec_date = rec.get("decision", {}).get("date")
@@ -206,7 +260,7 @@ def parse_procedures(idx: int | str) -> pl.DataFrame:
 
         rows.append(row)
 
-    return pl.DataFrame(rows)
+    return pl.DataFrame(rows, schema=_PROC_SCHEMA)
 
 
 def parse_procedures_rows(id_val):
@@ -0,0 +1,13 @@
+from ematools.data import with_progress
+
+
+def test_with_progress_counts_calls():
+    progress, double = with_progress(lambda x: 2 * x, total=3, description="Doubling")
+
+    with progress:
+        results = [double(i) for i in range(3)]
+
+    assert results == [0, 2, 4]
+    (task,) = progress.tasks
+    assert task.description == "Doubling"
+    assert task.completed == task.total == 3
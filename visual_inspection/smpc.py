@@ -14,18 +14,187 @@ Keyboard controls:
 - Left/Right arrows: Navigate between instances
 - q/Escape: Quit
 
-Labels are automatically saved to a CSV file after each action.
+Labels are automatically saved shortly after each action and collected into a
+CSV file (labels.csv) on quit.
 (disclaimer: Made with Claude Sonnet 4.5)
 """
 
 import csv
+import hashlib
+import itertools
+import multiprocessing
+import os
+import queue
+import threading
 import tkinter as tk
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 from tkinter import filedialog, messagebox, ttk
 
 import polars as pl
 import pymupdf  # PyMuPDF
-from PIL import Image, ImageTk
+
+# Number of rendered PDFs / formatted tables kept in memory for revisits
+CACHE_SIZE = 32
+# Number of open PDF documents kept around for re-rendering
+DOC_CACHE_SIZE = 8
+# Bounds for the PDF render zoom, which is otherwise fitted to the canvas
+MIN_ZOOM = 1.0
+MAX_ZOOM = 2.0
+# Zoom of the thumbnail used to detect pages without colour
+SAMPLE_ZOOM = 0.25
+# Interval at which the Tk thread checks for a finished page render
+RENDER_POLL_MS = 10
+# Delay before pending labels are written to disk
+FLUSH_DELAY_MS = 500
+# Duration of the status bar flash confirming a label
+FLASH_MS = 150
+# Folder next to labels.csv that holds the renders of File > Precache PDFs
+PRECACHE_DIR = "smpc_precache"
+# Number of CSV rows read and shown in the table panel
+TABLE_ROWS = 200
+# Cells wider than this are cut off in the table panel
+MAX_CELL_WIDTH = 40
+# Read size used to count the lines of CSVs longer than the table panel
+COUNT_CHUNK_SIZE = 1 << 20
+
+# Labels are kept as one byte per instance, using the keyboard shortcut as code
+NO_LABEL = ord(" ")
+LABEL_CODES = {
+    "correct": ord("c"),
+    "almost": ord("v"),
+    "bad": ord("b"),
+    "none": ord("n"),
+}
+LABEL_NAMES = {code: label for label, code in LABEL_CODES.items()} | {NO_LABEL: ""}
+# Any other label (e.g. edited by hand) keeps its text in a side table
+OTHER_LABEL = ord("?")
+
+
+def cache_put(cache, key, value, maxsize=CACHE_SIZE, on_evict=None):
+    """Insert into an LRU OrderedDict cache, evicting the oldest entries"""
+    cache[key] = value
+    cache.move_to_end(key)
+    while len(cache) > maxsize:
+        _, evicted = cache.popitem(last=False)
+        if on_evict:
+            on_evict(evicted)
+
+
+def is_grayscale(page):
+    """Whether a PDF page has no colour, judged from a small RGB thumbnail"""
+    pix = page.get_pixmap(matrix=pymupdf.Matrix(SAMPLE_ZOOM, SAMPLE_ZOOM))
+    samples = pix.samples
+    return samples[0::3] == samples[1::3] == samples[2::3]
+
+
+def render_page(page, viewport, gray=None, fmt="ppm"):
+    """Render a PDF page as PPM (or `fmt`) bytes
+
+    The zoom fits the page into the `viewport` (width, height) of the canvas,
+    clamped to [MIN_ZOOM, MAX_ZOOM], so no more pixels are rendered than shown.
+    Pages without colour are rendered as 8-bit grayscale (a third of the bytes);
+    pass `gray` to skip the check when it is already known.
+
+    pymupdf is not thread-safe, so within the Tk process this is only called
+    with the render lock held (see TableInspectionTool.render_pdf).
+    """
+    if gray is None:
+        gray = is_grayscale(page)
+    canvas_w, canvas_h = viewport
+    zoom = min(canvas_w / page.rect.width, canvas_h / page.rect.height)
+    zoom = max(MIN_ZOOM, min(MAX_ZOOM, zoom))
+    mat = pymupdf.Matrix(zoom, zoom)
+    colorspace = pymupdf.csGRAY if gray else pymupdf.csRGB
+    pix = page.get_pixmap(matrix=mat, colorspace=colorspace)
+
+    # Tk's photo image reads PPM (and grayscale PGM) natively, so no PIL
+    # conversion is needed
+    return pix.tobytes(fmt)
+
+
+def precache_name(pdf_path):
+    """File name of a PDF's precached render, unique per full path
+
+    Custom files can come from several folders with the same base names, so
+    the name is a hash of the absolute path rather than the base name.
+    """
+    digest = hashlib.sha1(os.path.abspath(pdf_path).encode()).hexdigest()[:16]
+    return f"{digest}.png"
+
+
+def is_fresh(pdf_path, png_path):
+    """Whether a precached render exists and is not older than its PDF"""
+    try:
+        return os.stat(png_path).st_mtime >= os.stat(pdf_path).st_mtime
+    except OSError:
+        return False
+
+
+def precache_page(pdf_path, viewport, out_path):
+    """Process-pool friendly render of a PDF's first page into a PNG file
+
+    PNG keeps the on-disk precache small; Tk reads it as well as PPM.
+    """
+    with pymupdf.open(pdf_path) as doc:
+        png = render_page(doc[0], viewport, fmt="png")
+    tmp = f"{out_path}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(png)
+    os.replace(tmp, out_path)
+
+
+def count_lines(path):
+    """Count the lines of a file over binary chunks, without decoding them"""
+    n_lines = 0
+    last = b"\n"
+    with open(path, "rb") as f:
+        while chunk := f.read(COUNT_CHUNK_SIZE):
+            n_lines += chunk.count(b"\n")
+            last = chunk[-1:]
+    # A last line without a trailing newline still counts
+    return n_lines + (last != b"\n")
+
+
+def format_table(csv_path):
+    """Format the first TABLE_ROWS rows of a CSV as a string table
+
+    Returns the table string and the total number of rows in the file. Rows
+    beyond the displayed head are not parsed but counted as lines, so cells
+    with quoted line breaks make that total an overestimate.
+    """
+    with open(csv_path, newline="", encoding="utf-8", errors="replace") as f:
+        reader = csv.reader(f)
+        header = next(reader, [])
+        rows = list(itertools.islice(reader, TABLE_ROWS + 1))
+    if len(rows) > TABLE_ROWS:
+        rows = rows[:TABLE_ROWS]
+        n_rows = max(count_lines(csv_path) - 1, TABLE_ROWS + 1)
+    else:
+        n_rows = len(rows)
+
+    def fit(cell):
+        cell = cell.replace("\n", " ")
+        if len(cell) > MAX_CELL_WIDTH:
+            return cell[: MAX_CELL_WIDTH - 1] + "…"
+        return cell
+
+    # Align columns using the widths of the displayed rows only
+    table = [[fit(cell) for cell in row] for row in [header, *rows]]
+    n_cols = max(len(row) for row in table)
+    widths = [
+        max((len(row[i]) for row in table if i < len(row)), default=0)
+        for i in range(n_cols)
+    ]
+    lines = [
+        " | ".join(cell.ljust(width) for cell, width in zip(row, widths)).rstrip()
+        for row in table
+    ]
+    lines.insert(1, "-+-".join("-" * width for width in widths))
+    if n_rows > len(rows):
+        lines.append(f"... ({n_rows - len(rows)} more rows)")
+    return "\n".join(lines), n_rows
 
 
 class TableInspectionTool:
@@ -38,8 +207,54 @@ class TableInspectionTool:
         self.pdf_files = []
         self.csv_files = []
         self.current_index = 0
-        self.labels = []
+        self.labels = bytearray()
+        self._other_labels = {}
+        self._pdf_names = []
+        self._csv_names = []
         self.labels_file = None
+        # Labels set during a session are appended to a small log (O(1) per
+        # label); labels.csv is rewritten from it on load and on quit
+        self.labels_log = None
+        self._labels_fh = None
+        # Indices labelled since the last write; bursts of labels are coalesced
+        # into one write, FLUSH_DELAY_MS after the last keypress
+        self._dirty = set()
+        self._flush_after_id = None
+
+        # Render caches keyed by file path (PhotoImages are kept referenced here,
+        # so Tk doesn't garbage-collect them)
+        self._pdf_cache = OrderedDict()
+        self._csv_cache = OrderedDict()
+
+        # Background prefetching of neighbouring instances. The worker only
+        # produces PPM bytes; PhotoImages are built on the Tk thread on first use.
+        self._prefetched = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._prefetch_queue = queue.Queue()
+
+        # Open documents, so revisits don't re-parse the PDF. pymupdf is not
+        # thread-safe: every pymupdf call in this process (open, render, close)
+        # happens under the render lock, whichever thread makes it.
+        self._doc_cache = OrderedDict()
+        self._render_lock = threading.Lock()
+        # Whether a PDF renders in grayscale, decided once per file
+        self._grayscale = {}
+
+        # Pages missing from the caches are rendered here while the CSV loads;
+        # a finished render is only shown if its PDF is still the pending one.
+        # Renders are serialised by the document lock, so one worker suffices.
+        self._render_executor = ThreadPoolExecutor(max_workers=1)
+        self._pending_pdf = None
+        # Number of on-screen renders queued; prefetching waits for them
+        self._foreground_renders = 0
+        self._foreground_done = threading.Condition()
+        threading.Thread(target=self._prefetch_worker, daemon=True).start()
+
+        # Opt-in bulk render of all PDFs (File > Precache PDFs) into files in
+        # precache_dir; only the file paths are kept in memory
+        self.precache_dir = None
+        self._precached = {}
+        self._data_generation = 0
 
         # Setup UI
         self.setup_ui()
@@ -47,6 +262,9 @@ class TableInspectionTool:
         # Bind keyboard events
         self.bind_keyboard_events()
 
+        # Closing the window saves the labels like q/Escape do
+        self.root.protocol("WM_DELETE_WINDOW", self.quit_app)
+
     def setup_ui(self):
         """Setup the user interface"""
         # Top menu bar
@@ -57,6 +275,7 @@ class TableInspectionTool:
         menubar.add_cascade(label="File", menu=file_menu)
         file_menu.add_command(label="Load Data Folder", command=self.load_data_folder)
         file_menu.add_command(label="Load Custom Files", command=self.load_custom_files)
+        file_menu.add_command(label="Precache PDFs", command=self.precache_pdfs)
         file_menu.add_separator()
         file_menu.add_command(label="Quit", command=self.quit_app)
 
@@ -143,6 +362,8 @@ class TableInspectionTool:
             xscrollcommand=pdf_scrollbar_x.set,
         )
         self.pdf_canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        # A single image item, whose image is swapped on navigation
+        self._pdf_item = self.pdf_canvas.create_image(0, 0, anchor=tk.NW)
 
         pdf_scrollbar_y.config(command=self.pdf_canvas.yview)
         pdf_scrollbar_x.config(command=self.pdf_canvas.xview)
@@ -163,10 +384,15 @@ class TableInspectionTool:
         table_scrollbar_x = ttk.Scrollbar(table_frame, orient=tk.HORIZONTAL)
         table_scrollbar_x.pack(side=tk.BOTTOM, fill=tk.X)
 
+        # Read-only display: no undo history, and only editable while inserting
         self.table_text = tk.Text(
             table_frame,
             wrap=tk.NONE,
             font=("Courier", 9),
+            undo=False,
+            maxundo=0,
+            takefocus=0,
+            state=tk.DISABLED,
             yscrollcommand=table_scrollbar_y.set,
             xscrollcommand=table_scrollbar_x.set,
         )
@@ -177,10 +403,10 @@ class TableInspectionTool:
 
         # Status bar
         self.status_var = tk.StringVar(value="Ready. Please load data using File menu.")
-        status_bar = ttk.Label(
+        self.status_bar = ttk.Label(
             self.root, textvariable=self.status_var, relief=tk.SUNKEN
         )
-        status_bar.pack(side=tk.BOTTOM, fill=tk.X)
+        self.status_bar.pack(side=tk.BOTTOM, fill=tk.X)
 
     def bind_keyboard_events(self):
         """Bind keyboard shortcuts"""
@@ -197,6 +423,8 @@ class TableInspectionTool:
         self.root.bind("q", lambda e: self.quit_app())
         self.root.bind("Q", lambda e: self.quit_app())
         self.root.bind("<Escape>", lambda e: self.quit_app())
+        # Write pending labels right away when the window loses focus
+        self.root.bind("<FocusOut>", lambda e: self.flush_labels(report=False))
 
     def load_data_folder(self):
         """Load PDFs and CSVs from a folder"""
@@ -204,30 +432,31 @@ class TableInspectionTool:
         if not folder:
             return
 
-        folder_path = Path(folder)
-
-        # Find all PDF and CSV files
-        pdf_files = sorted(folder_path.glob("*.pdf"))
-
-        # Try to match them by name
-        self.pdf_files = []
-        self.csv_files = []
-
-        for pdf_file in pdf_files:
-            # Look for corresponding CSV (same name but .csv extension)
-            csv_file = folder_path / f"{pdf_file.stem}.csv"
-            if csv_file.exists():
-                self.pdf_files.append(str(pdf_file))
-                self.csv_files.append(str(csv_file))
-
-        if not self.pdf_files:
+        # Find all PDF and CSV files in a single directory scan
+        pdfs, csvs = {}, {}
+        with os.scandir(folder) as entries:
+            for entry in entries:
+                if not entry.is_file():
+                    continue
+                stem, ext = os.path.splitext(entry.name)
+                if ext == ".pdf":
+                    pdfs[stem] = entry.path
+                elif ext == ".csv":
+                    csvs[stem] = entry.path
+
+        # Match them by name (same name but .csv extension)
+        stems = sorted(pdfs.keys() & csvs.keys(), key=lambda stem: pdfs[stem])
+
+        if not stems:
             messagebox.showwarning(
                 "No matches",
                 "No matching PDF-CSV pairs found. Files should have the same name.",
             )
             return
 
-        self.initialize_data()
+        self.initialize_data(
+            [pdfs[stem] for stem in stems], [csvs[stem] for stem in stems]
+        )
 
     def load_custom_files(self):
         """Load custom PDF and CSV file lists"""
@@ -252,30 +481,66 @@ class TableInspectionTool:
             messagebox.showerror("Error", "Number of PDF and CSV files must match!")
             return
 
-        self.pdf_files = list(pdf_files)
-        self.csv_files = list(csv_files)
-        self.initialize_data()
+        self.initialize_data(list(pdf_files), list(csv_files))
 
-    def initialize_data(self):
-        """Initialize labels file and load first instance"""
-        if not self.pdf_files:
+    def initialize_data(self, pdf_files, csv_files):
+        """Switch to a new data set: initialize labels file and load first instance"""
+        if not pdf_files:
             return
 
+        with self._cache_lock:
+            self._pdf_cache.clear()
+            self._csv_cache.clear()
+            self._prefetched.clear()
+            self._precached.clear()
+        self._data_generation += 1
+        self.close_documents()
+
+        # Finish the previous data set's labels before switching
+        if self._labels_fh:
+            self.compact_labels()
+
+        self.pdf_files = pdf_files
+        self.csv_files = csv_files
+
         # Create or load labels file
         base_dir = Path(self.pdf_files[0]).parent
         self.labels_file = base_dir / "labels.csv"
+        self.labels_log = self.labels_file.with_suffix(".log")
 
         # Initialize labels list
-        self.labels = [""] * len(self.pdf_files)
+        self.labels = bytearray([NO_LABEL]) * len(self.pdf_files)
+        self._other_labels = {}
+        self._dirty = set()
+        # File names for display and labels.csv, computed once per data set
+        self._pdf_names = [os.path.basename(p) for p in self.pdf_files]
+        self._csv_names = [os.path.basename(c) for c in self.csv_files]
+
+        # Pick up renders precached in an earlier session
+        self.precache_dir = base_dir / PRECACHE_DIR
+        if self.precache_dir.is_dir():
+            existing = set(os.listdir(self.precache_dir))
+            precached = {}
+            for pdf_path in self.pdf_files:
+                png_name = precache_name(pdf_path)
+                png_path = self.precache_dir / png_name
+                # Skip renders of a PDF that was regenerated since
+                if png_name in existing and is_fresh(pdf_path, png_path):
+                    precached[pdf_path] = png_path
+            with self._cache_lock:
+                self._precached = precached
 
         # Load existing labels if file exists
         if self.labels_file.exists():
             try:
-                with open(self.labels_file, "r", newline="", encoding="utf-8") as f:
-                    reader = csv.DictReader(f)
-                    for i, row in enumerate(reader):
-                        if i < len(self.labels):
-                            self.labels[i] = row.get("label", "")
+                saved = pl.read_csv(
+                    self.labels_file,
+                    columns=["index", "label"],
+                    schema_overrides={"index": pl.Int64, "label": pl.String},
+                )
+                for i, label in zip(saved["index"], saved["label"]):
+                    if i is not None and 0 <= i < len(self.labels) and label:
+                        self.store_label(i, label)
                 self.status_var.set(
                     f"Loaded existing labels from {self.labels_file.name}"
                 )
@@ -288,30 +553,113 @@ class TableInspectionTool:
             self.save_all_labels()
             self.status_var.set(f"Created new labels file: {self.labels_file.name}")
 
+        # A leftover log means the last session did not quit cleanly
+        if self.labels_log.exists():
+            self.replay_labels_log()
+            self.compact_labels()
+        self._labels_fh = open(self.labels_log, "a", encoding="utf-8")
+
         # Load first instance
         self.current_index = 0
         self.load_instance(0)
 
+    def store_label(self, index, label):
+        """Set the label of an instance, keeping unknown labels verbatim"""
+        code = LABEL_CODES.get(label, NO_LABEL if not label else OTHER_LABEL)
+        if code == OTHER_LABEL:
+            self._other_labels[index] = label
+        else:
+            self._other_labels.pop(index, None)
+        self.labels[index] = code
+
+    def label_name(self, index):
+        """The label of an instance as text"""
+        code = self.labels[index]
+        if code == OTHER_LABEL:
+            return self._other_labels[index]
+        return LABEL_NAMES[code]
+
+    def replay_labels_log(self):
+        """Apply the label records of the labels log"""
+        with open(self.labels_log, "r", encoding="utf-8") as f:
+            for line in f:
+                index, _, label = line.rstrip("\n").partition(",")
+                if index.isdigit() and int(index) < len(self.labels):
+                    self.store_label(int(index), label)
+
+    def schedule_flush(self):
+        """(Re)schedule writing the pending labels"""
+        if self._flush_after_id is not None:
+            self.root.after_cancel(self._flush_after_id)
+        self._flush_after_id = self.root.after(FLUSH_DELAY_MS, self.flush_labels)
+
+    def flush_labels(self, report=True):
+        """Append the pending labels to the labels log in a single write
+
+        With `report=False` a failure only shows in the status bar, so a flush
+        on focus loss can't open a dialog that triggers another flush.
+        """
+        if self._flush_after_id is not None:
+            self.root.after_cancel(self._flush_after_id)
+            self._flush_after_id = None
+        if not self._dirty or not self._labels_fh:
+            return True
+
+        try:
+            self._labels_fh.write(
+                "".join(
+                    f"{i},{self.label_name(i)}\n" for i in sorted(self._dirty)
+                )
+            )
+            self._labels_fh.flush()
+            self._dirty.clear()
+            return True
+        except Exception as e:
+            if report:
+                messagebox.showerror("Error", f"Failed to save labels: {e}")
+            else:
+                self.status_var.set(f"Failed to save labels: {e}")
+            return False
+
+    def compact_labels(self):
+        """Rewrite the labels CSV and drop the labels log"""
+        # Pending labels go to the log first, so they survive a failed rewrite
+        self.flush_labels()
+        if self._labels_fh:
+            self._labels_fh.close()
+            self._labels_fh = None
+        if self.save_all_labels():
+            # labels.csv is written from self.labels, which includes pending labels
+            self._dirty.clear()
+            self.labels_log.unlink(missing_ok=True)
+
     def save_all_labels(self):
         """Save all labels to CSV file"""
         if not self.labels_file:
             return
 
         try:
-            with open(self.labels_file, "w", newline="", encoding="utf-8") as f:
-                fieldnames = ["index", "pdf_file", "csv_file", "label"]
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                writer.writeheader()
-
-                for i in range(len(self.pdf_files)):
-                    writer.writerow(
-                        {
-                            "index": i,
-                            "pdf_file": Path(self.pdf_files[i]).name,
-                            "csv_file": Path(self.csv_files[i]).name,
-                            "label": self.labels[i],
-                        }
-                    )
+            labels = pl.Series(self.labels, dtype=pl.UInt8).replace_strict(
+                LABEL_NAMES, default=None, return_dtype=pl.String
+            )
+            if self._other_labels:
+                labels = labels.scatter(
+                    list(self._other_labels), list(self._other_labels.values())
+                )
+            pl.DataFrame(
+                {
+                    "index": range(len(self.labels)),
+                    "pdf_file": self._pdf_names,
+                    "csv_file": self._csv_names,
+                    "label": labels,
+                },
+                schema={
+                    "index": pl.Int64,
+                    "pdf_file": pl.String,
+                    "csv_file": pl.String,
+                    "label": pl.String,
+                },
+            ).write_csv(self.labels_file)
             return True
         except Exception as e:
             messagebox.showerror("Error", f"Failed to save labels: {e}")
@@ -329,7 +677,7 @@ class TableInspectionTool:
         self.index_label.config(text=f"Instance {index + 1} / {total}")
 
         # Update current label display
-        current_label = self.labels[index]
+        current_label = self.label_name(index)
         if current_label:
             self.current_label_var.set(f"Current: {current_label.upper()}")
         else:
@@ -339,67 +687,277 @@ class TableInspectionTool:
         self.load_pdf(self.pdf_files[index])
 
         # Load CSV
-        self.load_csv(self.csv_files[index])
+        n_rows = self.load_csv(self.csv_files[index])
 
         # Update status
-        pdf_name = Path(self.pdf_files[index]).name
-        csv_name = Path(self.csv_files[index]).name
-        self.status_var.set(f"Viewing: {pdf_name} | {csv_name}")
+        pdf_name = self._pdf_names[index]
+        csv_name = self._csv_names[index]
+        rows_info = f" ({n_rows} rows)" if n_rows is not None else ""
+        self.status_var.set(f"Viewing: {pdf_name} | {csv_name}{rows_info}")
+
+        # Warm up the neighbours while the user looks at this instance
+        viewport = self.pdf_viewport()
+        self._prefetch_queue.put(
+            [
+                (self.pdf_files[i], self.csv_files[i], viewport)
+                for i in (index + 1, index - 1)
+                if 0 <= i < total
+            ]
+        )
 
-    def load_pdf(self, pdf_path):
-        """Load and display PDF in left panel"""
-        try:
-            # Open PDF with PyMuPDF
-            doc = pymupdf.open(pdf_path)
+    def pdf_viewport(self):
+        """Size of the PDF canvas, read on the Tk thread for use by the renderer"""
+        return self.pdf_canvas.winfo_width(), self.pdf_canvas.winfo_height()
+
+    def _prefetch_worker(self):
+        """Decode queued instances into the caches (runs on a daemon thread)"""
+        while True:
+            pairs = self._prefetch_queue.get()
+            # Only the most recent request matters when navigating quickly
+            while not self._prefetch_queue.empty():
+                pairs = self._prefetch_queue.get_nowait()
+
+            for pdf_path, csv_path, viewport in pairs:
+                # The page on screen goes first
+                with self._foreground_done:
+                    self._foreground_done.wait_for(lambda: not self._foreground_renders)
+                with self._cache_lock:
+                    need_pdf = (
+                        pdf_path not in self._pdf_cache
+                        and pdf_path not in self._prefetched
+                        and pdf_path not in self._precached
+                    )
+                    need_csv = csv_path not in self._csv_cache
+                try:
+                    if need_pdf:
+                        ppm = self.render_pdf(pdf_path, viewport)
+                        with self._cache_lock:
+                            cache_put(self._prefetched, pdf_path, ppm)
+                    if need_csv:
+                        table = format_table(csv_path)
+                        with self._cache_lock:
+                            cache_put(self._csv_cache, csv_path, table)
+                except Exception:
+                    # Errors are reported when the instance is actually shown
+                    continue
+
+    def render_pdf(self, pdf_path, viewport):
+        """Render the first page of a PDF from the document pool (any thread)"""
+        with self._render_lock:
+            doc = self._doc_cache.get(pdf_path)
+            if doc is None:
+                # Open PDF with PyMuPDF
+                doc = pymupdf.open(pdf_path)
+                cache_put(
+                    self._doc_cache,
+                    pdf_path,
+                    doc,
+                    maxsize=DOC_CACHE_SIZE,
+                    on_evict=lambda evicted: evicted.close(),
+                )
+            else:
+                self._doc_cache.move_to_end(pdf_path)
 
             # Render first page (can be extended to show multiple pages)
             page = doc[0]
+            gray = self._grayscale.get(pdf_path)
+            if gray is None:
+                gray = self._grayscale[pdf_path] = is_grayscale(page)
+            return render_page(page, viewport, gray)
+
+    def close_documents(self):
+        """Close all pooled PDF documents"""
+        with self._render_lock:
+            for doc in self._doc_cache.values():
+                doc.close()
+            self._doc_cache.clear()
+            self._grayscale.clear()
+
+    def precache_pdfs(self):
+        """Render all PDFs in parallel worker processes into the precache folder"""
+        if not self.pdf_files:
+            messagebox.showwarning("No Data", "Please load data first!")
+            return
 
-            # Render at higher resolution for better quality
-            zoom = 2.0
-            mat = pymupdf.Matrix(zoom, zoom)
-            pix = page.get_pixmap(matrix=mat)
+        try:
+            self.precache_dir.mkdir(exist_ok=True)
+        except Exception as e:
+            messagebox.showerror("Error", f"Could not create precache folder: {e}")
+            return
 
-            # Convert to PIL Image
-            img = Image.frombytes("RGB", (pix.width, pix.height), pix.samples)
+        viewport = self.pdf_viewport()
+        # Spawned rather than forked workers: this process runs the prefetch and
+        # render threads, whose locks must not be copied into the children
+        executor = ProcessPoolExecutor(mp_context=multiprocessing.get_context("spawn"))
+        futures = {}
+        for pdf_path in self.pdf_files:
+            out_path = self._precached.get(pdf_path)
+            if out_path is not None and is_fresh(pdf_path, out_path):
+                continue
+            out_path = self.precache_dir / precache_name(pdf_path)
+            future = executor.submit(precache_page, pdf_path, viewport, str(out_path))
+            futures[future] = (pdf_path, out_path)
+        executor.shutdown(wait=False)
+
+        self.status_var.set(f"Precaching {len(futures)} PDFs...")
+        self.root.after(200, self._collect_precache, futures, self._data_generation)
+
+    def _collect_precache(self, futures, generation):
+        """Move finished precache renders into the cache (polled on the Tk thread)"""
+        if generation != self._data_generation:
+            # A different data set was loaded in the meantime
+            for future in futures:
+                future.cancel()
+            return
 
-            # Convert to PhotoImage
-            self.pdf_image = ImageTk.PhotoImage(img)
+        for future in [f for f in futures if f.done()]:
+            pdf_path, out_path = futures.pop(future)
+            if not future.cancelled() and future.exception() is None:
+                with self._cache_lock:
+                    self._precached[pdf_path] = out_path
 
-            # Display on canvas
-            self.pdf_canvas.delete("all")
-            self.pdf_canvas.create_image(0, 0, anchor=tk.NW, image=self.pdf_image)
-            self.pdf_canvas.config(scrollregion=self.pdf_canvas.bbox(tk.ALL))
+        if futures:
+            self.root.after(200, self._collect_precache, futures, generation)
+        else:
+            self.status_var.set(f"Precached {len(self._precached)} PDFs")
 
-            doc.close()
+    def load_pdf(self, pdf_path):
+        """Load and display PDF in left panel
 
+        Pages that are not cached yet are rendered on the render pool, so the
+        CSV can be loaded meanwhile; the result is shown by _collect_render.
+        """
+        self._pending_pdf = pdf_path
+        try:
+            with self._cache_lock:
+                if pdf_path in self._pdf_cache:
+                    self._pdf_cache.move_to_end(pdf_path)
+                    photo = self._pdf_cache[pdf_path]
+                else:
+                    photo = None
+                    ppm = self._prefetched.pop(pdf_path, None)
+                    precached = self._precached.get(pdf_path)
+            if photo is not None:
+                self.show_pdf(photo)
+            elif ppm is not None:
+                self.show_pdf_ppm(pdf_path, ppm)
+            elif precached is not None and is_fresh(pdf_path, precached):
+                self.show_pdf_ppm(pdf_path, precached.read_bytes())
+            else:
+                if precached is not None:
+                    # The PDF changed after it was precached
+                    with self._cache_lock:
+                        self._precached.pop(pdf_path, None)
+                # Blank the previous page rather than show it next to this table
+                self.pdf_canvas.delete("error")
+                self.pdf_canvas.itemconfigure(self._pdf_item, image="")
+                with self._foreground_done:
+                    self._foreground_renders += 1
+                future = self._render_executor.submit(
+                    self._render_foreground, pdf_path, self.pdf_viewport()
+                )
+                self.root.after(RENDER_POLL_MS, self._collect_render, future, pdf_path)
         except Exception as e:
-            self.pdf_canvas.delete("all")
-            self.pdf_canvas.create_text(
-                10,
-                10,
-                anchor=tk.NW,
-                text=f"Error loading PDF:\n{e}",
-                fill="red",
-                font=("Arial", 10),
-            )
+            self.show_pdf_error(e)
 
-    def load_csv(self, csv_path):
-        """Load and display CSV table in right panel"""
+    def _render_foreground(self, pdf_path, viewport):
+        """Render a page for display unless the user has moved on (render pool)"""
+        try:
+            if pdf_path != self._pending_pdf:
+                return None
+            return self.render_pdf(pdf_path, viewport)
+        finally:
+            with self._foreground_done:
+                self._foreground_renders -= 1
+                self._foreground_done.notify_all()
+
+    def _collect_render(self, future, pdf_path):
+        """Show a page rendered on the render pool (polled on the Tk thread)"""
+        if not future.done():
+            self.root.after(RENDER_POLL_MS, self._collect_render, future, pdf_path)
+            return
+
+        stale = pdf_path != self._pending_pdf
         try:
-            # Read CSV with polars
-            df = pl.read_csv(csv_path)
+            ppm = future.result()
+        except Exception as e:
+            if not stale:
+                self.show_pdf_error(e)
+            return
 
-            # Format as string table
-            table_str = str(df)
+        if ppm is None:
+            # Skipped, as another page was requested in the meantime
+            return
+        if stale:
+            # The user moved on; keep the render for when they come back
+            with self._cache_lock:
+                cache_put(self._prefetched, pdf_path, ppm)
+            return
+        try:
+            self.show_pdf_ppm(pdf_path, ppm)
+        except Exception as e:
+            self.show_pdf_error(e)
+
+    def show_pdf_ppm(self, pdf_path, ppm):
+        """Turn rendered PPM (or PNG) bytes into a cached PhotoImage and display it"""
+        photo = tk.PhotoImage(data=ppm)
+        with self._cache_lock:
+            cache_put(self._pdf_cache, pdf_path, photo)
+        self.show_pdf(photo)
+
+    def show_pdf(self, photo):
+        """Display a PhotoImage on the PDF canvas"""
+        self.pdf_image = photo
+
+        # Display on canvas
+        self.pdf_canvas.delete("error")
+        self.pdf_canvas.itemconfigure(self._pdf_item, image=self.pdf_image)
+        self.pdf_canvas.config(
+            scrollregion=(0, 0, self.pdf_image.width(), self.pdf_image.height())
+        )
+
+    def show_pdf_error(self, error):
+        """Display an error message instead of the PDF page"""
+        self.pdf_canvas.delete("error")
+        self.pdf_canvas.itemconfigure(self._pdf_item, image="")
+        self.pdf_canvas.create_text(
+            10,
+            10,
+            anchor=tk.NW,
+            text=f"Error loading PDF:\n{error}",
+            fill="red",
+            font=("Arial", 10),
+            tags="error",
+        )
+
+    def load_csv(self, csv_path):
+        """Load and display CSV table in right panel, returning its row count"""
+        try:
+            with self._cache_lock:
+                table = self._csv_cache.get(csv_path)
+                if table is not None:
+                    self._csv_cache.move_to_end(csv_path)
+            if table is None:
+                table = format_table(csv_path)
+                with self._cache_lock:
+                    cache_put(self._csv_cache, csv_path, table)
+            table_str, n_rows = table
 
             # Display in text widget
-            self.table_text.delete(1.0, tk.END)
-            self.table_text.insert(1.0, table_str)
+            self.show_table(table_str)
+            return n_rows
 
         except Exception as e:
-            self.table_text.delete(1.0, tk.END)
-            self.table_text.insert(1.0, f"Error loading CSV:\n{e}")
+            self.show_table(f"Error loading CSV:\n{e}")
+            return None
+
+    def show_table(self, text):
+        """Replace the contents of the (read-only) table panel in one insert"""
+        self.table_text.configure(state=tk.NORMAL)
+        self.table_text.delete(1.0, tk.END)
+        self.table_text.insert(1.0, text)
+        self.table_text.configure(state=tk.DISABLED)
+        self.table_text.update_idletasks()
 
     def set_label(self, label_value):
         """Set label for current instance and move to next"""
@@ -408,18 +966,29 @@ class TableInspectionTool:
             return
 
         # Update label
-        self.labels[self.current_index] = label_value
+        index = self.current_index
+        self.store_label(index, label_value)
 
-        # Save to file
-        if not self.save_all_labels():
-            return  # Don't advance if save failed
+        # Save to file (batched with other labels set shortly after)
+        self._dirty.add(index)
+        self.schedule_flush()
 
         # Update display
         self.current_label_var.set(f"Current: {label_value.upper()}")
-        self.status_var.set(f"Labeled as '{label_value}' and saved. Moving to next...")
 
-        # Auto-advance to next instance
-        self.root.after(500, self.next_instance)  # Small delay for user feedback
+        # Auto-advance to next instance right away, instead of holding it back
+        # for feedback; the status bar confirms the label that was applied
+        self.next_instance()
+        self.status_var.set(
+            f"Labeled {index + 1} ({self._pdf_names[index]}) as '{label_value}'. "
+            f"{self.status_var.get()}"
+        )
+        self.flash_status()
+
+    def flash_status(self):
+        """Briefly highlight the status bar"""
+        self.status_bar.configure(foreground="green")
+        self.root.after(FLASH_MS, lambda: self.status_bar.configure(foreground=""))
 
     def next_instance(self):
         """Navigate to next instance"""
@@ -444,10 +1013,12 @@ class TableInspectionTool:
 
     def quit_app(self):
         """Quit application"""
-        if self.labels_file and any(self.labels):
+        if self.labels_file:
             # Make sure everything is saved
-            self.save_all_labels()
+            self.compact_labels()
 
+        self._render_executor.shutdown(wait=False, cancel_futures=True)
+        self.close_documents()
         self.root.quit()
 
 